@@ -11,12 +11,15 @@ from meltano.core.utils import EnvVarMissingBehavior, expand_env_vars
 
 if t.TYPE_CHECKING:
     from meltano.core.project import Project
-    from meltano.core.setting_definition import SettingDefinition
+    from meltano.core.setting_definition import EnvVar, SettingDefinition
 
 
 class PluginSettingsService(SettingsService):  # noqa: WPS214
     """Settings manager for Meltano plugins."""
 
+    # `__dict__` is kept for `cached_property` (`inherited_settings_service`)
+    __slots__ = ("plugin", "environment_plugin_config", "__dict__")
+
     def __init__(  # noqa: WPS210
         self,
         project: Project,
@@ -120,8 +123,12 @@ class PluginSettingsService(SettingsService):  # noqa: WPS214
         """
         return self.plugin.docs
 
-    def setting_env_vars(self, setting_def: SettingDefinition, for_writing=False):
-        """Get environment variables for a setting.
+    def _setting_env_vars(
+        self,
+        setting_def: SettingDefinition,
+        for_writing: bool = False,
+    ) -> list[EnvVar]:
+        """Build environment variables for a setting.
 
         Args:
             setting_def: The setting definition.
@@ -131,11 +138,22 @@ class PluginSettingsService(SettingsService):  # noqa: WPS214
             Environment variables for a setting.
         """
         return setting_def.env_vars(
-            prefixes=self.plugin.env_prefixes(for_writing=for_writing),
+            prefixes=self._cached_env_prefixes(for_writing=for_writing),
             include_custom=self.plugin.is_shadowing or for_writing,
             for_writing=for_writing,
         )
 
+    def _resolve_env_prefixes(self, for_writing: bool = False) -> list[str]:
+        """Resolve the prefixes for setting environment variables.
+
+        Args:
+            for_writing: Whether to get prefixes for writing environment variables.
+
+        Returns:
+            The plugin's environment variable prefixes.
+        """
+        return self.plugin.env_prefixes(for_writing=for_writing)
+
     @property
     def db_namespace(self):
         """Return namespace for setting value records in system database.
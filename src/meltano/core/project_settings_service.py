@@ -21,6 +21,10 @@ logger = structlog.get_logger(__name__)
 class ProjectSettingsService(SettingsService):  # noqa: WPS214
     """Project Settings Service."""
 
+    # The class-level `config_override` below shadows the inherited slot, so
+    # instances keep a `__dict__` to hold their own merged overrides.
+    __slots__ = ("__dict__",)
+
     config_override = {}
     supports_environments = False
 
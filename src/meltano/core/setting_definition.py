@@ -381,7 +381,7 @@ class SettingDefinition(NameEq, Canonical):
 
     def env_vars(
         self,
-        prefixes: list[str],
+        prefixes: t.Sequence[str],
         include_custom: bool = True,
         for_writing: bool = False,
     ) -> list[EnvVar]:
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import os
+import sys
 import typing as t
 import warnings
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_left
+from collections.abc import Mapping
 from contextlib import contextmanager, suppress
 from enum import Enum
 
@@ -22,6 +25,7 @@ from meltano.core.utils import expand_env_vars as do_expand_env_vars
 
 if t.TYPE_CHECKING:
     from meltano.core.project import Project
+    from meltano.core.setting_definition import EnvVar
     from meltano.core.settings_store import SettingsStoreManager
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -80,9 +84,82 @@ class FeatureNotAllowedException(Exception):
         return f"{self.feature} not enabled."
 
 
+class _LayeredEnv(Mapping):
+    """Read-only view of a settings service's env overrides over `os.environ`."""
+
+    __slots__ = ("_settings_service",)
+
+    def __init__(self, settings_service: SettingsService):
+        """Create a new layered environment view.
+
+        Args:
+            settings_service: the settings service whose `env_override` to use.
+        """
+        self._settings_service = settings_service
+
+    def __getitem__(self, key: str) -> str:
+        """Return the value of an env var, preferring the overrides.
+
+        Args:
+            key: the env var name
+
+        Returns:
+            the env var value
+        """
+        try:
+            return self._settings_service.env_override[key]
+        except KeyError:
+            return os.environ[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether an env var is set.
+
+        Args:
+            key: the env var name
+
+        Returns:
+            whether the env var is set in the overrides or `os.environ`
+        """
+        return key in self._settings_service.env_override or key in os.environ
+
+    def __iter__(self) -> t.Iterator[str]:
+        """Iterate over the env var names.
+
+        Yields:
+            the names in `os.environ`, then those only set in the overrides
+        """
+        env_override = self._settings_service.env_override
+        yield from os.environ
+        yield from (key for key in env_override if key not in os.environ)
+
+    def __len__(self) -> int:
+        """Return the number of env vars.
+
+        Returns:
+            the number of distinct env var names
+        """
+        return len(os.environ.keys() | self._settings_service.env_override.keys())
+
+
 class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
     """Abstract base class for managing settings."""
 
+    __slots__ = (
+        "project",
+        "show_hidden",
+        "env_override",
+        "config_override",
+        "_setting_defs",
+        "_setting_index",
+        "_setting_defs_extras",
+        "_setting_defs_non_extras",
+        "_sorted_setting_names",
+        "_env_prefixes_cache",
+        "_env_vars_cache",
+        "_env",
+        "_flat_meltano_yml_config",
+    )
+
     LOGGING = False
     supports_environments = True
 
@@ -106,6 +183,17 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
         self.env_override = env_override or {}
         self.config_override = config_override or {}
         self._setting_defs: list[SettingDefinition] | None = None
+        self._setting_index: dict[str, SettingDefinition] = {}
+        self._setting_defs_extras: list[SettingDefinition] = []
+        self._setting_defs_non_extras: list[SettingDefinition] = []
+        self._sorted_setting_names: list[tuple[str, int]] = []
+        self._env_prefixes_cache: dict[bool, tuple[str, ...]] = {}
+        self._env_vars_cache: dict[
+            tuple[int, bool],
+            tuple[SettingDefinition, list[EnvVar]],
+        ] = {}
+        self._env = _LayeredEnv(self)
+        self._flat_meltano_yml_config: tuple[dict, dict] | None = None
 
     @property
     @abstractmethod
@@ -183,20 +271,50 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
     def flat_meltano_yml_config(self):
         """Flatten meltano config.
 
+        The flattened config is cached for as long as `meltano_yml_config`
+        returns the same object. Services that build a new config dict on
+        every access, like `PluginSettingsService`, flatten it each time so
+        that in-place edits to the plugin config are never missed.
+
         Returns:
             the flattened config
 
         """
-        return flatten(self.meltano_yml_config, "dot")
+        config = self.meltano_yml_config
+        cached = self._flat_meltano_yml_config
+        if cached is None or cached[0] is not config:
+            cached = self._flat_meltano_yml_config = (config, flatten(config, "dot"))
+        return cached[1]
+
+    def invalidate_flat_meltano_yml_config(self) -> None:
+        """Forget the flattened config, so it is rebuilt on next access.
+
+        Store managers call this after writing to `meltano.yml`.
+        """
+        self._flat_meltano_yml_config = None
 
     @property
-    def env(self):
-        """Return the environment as a dict.
+    def env(self) -> t.Mapping[str, str]:
+        """Return the environment as a mapping.
+
+        The overrides are layered over `os.environ` without copying either.
+
+        Returns:
+            the environment as a mapping.
+        """
+        return self._env
+
+    @classmethod
+    def unredacted_items(cls, values: dict) -> t.Iterator[tuple[str, t.Any]]:
+        """Iterate over the items in a dictionary that are not redacted.
+
+        Args:
+            values: the dictionary to iterate over
 
         Returns:
-            the environment as a dict.
+            an iterator of the `(key, value)` pairs that are not redacted
         """
-        return {**os.environ, **self.env_override}
+        return ((key, val) for key, val in values.items() if val != REDACTED_VALUE)
 
     @classmethod
     def unredact(cls, values: dict) -> dict:
@@ -208,7 +326,7 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
         Returns:
             the unredacted dictionary
         """
-        return {key: val for key, val in values.items() if val != REDACTED_VALUE}
+        return dict(cls.unredacted_items(values))
 
     def config_with_metadata(
         self,
@@ -237,23 +355,39 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
         else:
             source_manager = source.manager(self, bulk=True, **kwargs)
 
-        config = {}
-        for setting_def in self.definitions(extras=extras):
-            if prefix and not setting_def.name.startswith(prefix):
-                continue
+        setting_defs = (
+            self.definitions_with_prefix(prefix, extras=extras)
+            if prefix
+            else self.definitions(extras=extras)
+        )
+
+        # Read all the values in one go, so stores can batch their lookups
+        stored_values = source_manager.get_many(setting_defs)
+
+        # Every matched name starts with the prefix, so only its length matters
+        prefix_len = len(prefix) if prefix else 0
 
-            value, metadata = self.get_with_metadata(
+        config = {}
+        for setting_def, (stored_value, get_metadata) in zip(
+            setting_defs,
+            stored_values,
+        ):
+            self.log("Getting setting '%s'", setting_def.name)
+            value, metadata = self._resolve_value(
                 setting_def.name,
+                stored_value,
+                get_metadata,
                 setting_def=setting_def,
+                redacted=kwargs.get("redacted", False),
                 source=source,
                 source_manager=source_manager,
-                **kwargs,
+                expand_env_vars=kwargs.get("expand_env_vars", True),
             )
 
-            config[setting_def.name[len(prefix) :] if prefix else setting_def.name] = {
-                **metadata,
-                "value": value,
-            }
+            # `_resolve_value` returns a fresh dict, so it can be reused as is
+            metadata["value"] = value
+            name = setting_def.name
+            config[name[prefix_len:] if prefix_len else name] = metadata
 
         return config
 
@@ -340,50 +474,77 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
         if setting_def:
             name = setting_def.name
 
-        self.log(f"Getting setting '{name}'")
+        self.log("Getting setting '%s'", name)
+
+        manager = source_manager or source.manager(self, **kwargs)
+        value, metadata = self._resolve_value(
+            name,
+            *manager.get(name, setting_def=setting_def),
+            setting_def=setting_def,
+            redacted=redacted,
+            source=source,
+            source_manager=source_manager,
+            expand_env_vars=expand_env_vars,
+        )
+
+        if setting_def is None and metadata["source"] is SettingValueStore.DEFAULT:
+            warnings.warn(
+                (
+                    f"Unknown setting {name!r} - the default value "
+                    f"`{value!r}` will be used"
+                ),
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+        return value, metadata
+
+    def _resolve_value(  # noqa: WPS211
+        self,
+        name: str,
+        value: t.Any,
+        get_metadata: dict[str, t.Any],
+        setting_def: SettingDefinition | None = None,
+        redacted: bool = False,
+        source: SettingValueStore = SettingValueStore.AUTO,
+        source_manager: SettingsStoreManager | None = None,
+        expand_env_vars: bool = True,
+    ) -> tuple[t.Any, dict[str, t.Any]]:
+        """Turn a value read from a store into a setting value with metadata.
+
+        Args:
+            name: the name of the setting
+            value: the value read from the store
+            get_metadata: the metadata returned by the store
+            setting_def: the `SettingDefinition` of the setting
+            redacted: Whether the setting is redacted
+            source: the `SettingsStore` to use
+            source_manager: the `SettingsStoreManager` to use
+            expand_env_vars: Whether to expand nested environment variables
 
+        Returns:
+            a tuple of the setting value and metadata
+        """
         metadata: dict[str, t.Any] = {
             "name": name,
             "source": source,
             "setting": setting_def,
+            **get_metadata,
         }
 
-        expandable_env = {**self.project.dotenv_env, **self.env}
-        if setting_def and setting_def.is_extra:
-            expandable_env.update(
-                self.as_env(
-                    extras=False,
+        if expand_env_vars and metadata.get("expandable", False):
+            metadata["expandable"] = False
+            # Only strings and collections can reference env vars, so don't
+            # bother resolving the expansion env for anything else
+            if isinstance(value, (str, t.Mapping, list)):
+                value = self._expand_env_vars(
+                    value,
+                    metadata,
+                    setting_def=setting_def,
                     redacted=redacted,
                     source=source,
                     source_manager=source_manager,
-                ),
-            )
-
-        manager = source_manager or source.manager(self, **kwargs)
-        value, get_metadata = manager.get(name, setting_def=setting_def)
-        metadata.update(get_metadata)
-
-        # Can't do conventional SettingsService.feature_flag call to check;
-        # it would result in circular dependency
-        strict_env_var_mode, _ = source.manager(self.project_settings_service).get(
-            f"{FEATURE_FLAG_PREFIX}.{FeatureFlags.STRICT_ENV_VAR_MODE}",
-            cast_value=True,
-        )
-        if expand_env_vars and metadata.get("expandable", False):
-            metadata["expandable"] = False
-            expanded_value = do_expand_env_vars(
-                value,
-                env=expandable_env,
-                if_missing=EnvVarMissingBehavior(int(strict_env_var_mode)),
-            )
-            # https://github.com/meltano/meltano/issues/7189#issuecomment-1396112167
-            if value and not expanded_value:  # The whole string was missing env vars
-                expanded_value = None  # type: ignore[assignment]
-
-            if expanded_value != value:
-                metadata["expanded"] = True
-                metadata["unexpanded_value"] = value
-                value = expanded_value
+                )
 
         if setting_def:
             # Expand flattened config values if the root value is the default
@@ -392,32 +553,20 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
                 metadata["source"]
                 in {SettingValueStore.DEFAULT, SettingValueStore.INHERITED}
             ):
-                object_value = {}
-                object_source = metadata["source"]
-                for setting_key in (setting_def.name, *setting_def.aliases):
-                    flat_config_metadata = self.config_with_metadata(
-                        prefix=f"{setting_key}.",
-                        redacted=redacted,
-                        source=source,
-                        source_manager=source_manager,
-                        expand_env_vars=expand_env_vars,
-                    )
-                    for nested_key, config_metadata in flat_config_metadata.items():
-                        if nested_key in object_value:
-                            continue
-
-                        object_value[nested_key] = config_metadata["value"]
-
-                        nested_source = config_metadata["source"]
-                        if nested_source.overrides(object_source):
-                            object_source = nested_source
-
+                object_value, object_source = self._object_children(
+                    (setting_def.name, *setting_def.aliases),
+                    metadata["source"],
+                    source=source,
+                    source_manager=source_manager,
+                    redacted=redacted,
+                    expand_env_vars=expand_env_vars,
+                )
                 if object_value:
-                    value = object_value  # type: ignore[assignment]
+                    value = object_value
                     metadata["source"] = object_source
 
             cast_value = setting_def.cast_value(value)
-            if cast_value != value:
+            if cast_value is not value and cast_value != value:
                 metadata["uncast_value"] = value
                 value = cast_value
 
@@ -427,19 +576,113 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
                 metadata["redacted"] = True
                 value = REDACTED_VALUE
 
-        self.log(f"Got setting {name!r} with metadata: {metadata}")
+        self.log("Got setting %r with metadata: %s", name, metadata)
+        return value, metadata
 
-        if setting_def is None and metadata["source"] is SettingValueStore.DEFAULT:
-            warnings.warn(
-                (
-                    f"Unknown setting {name!r} - the default value "
-                    f"`{value!r}` will be used"
+    def _expand_env_vars(
+        self,
+        value: t.Any,
+        metadata: dict[str, t.Any],
+        setting_def: SettingDefinition | None = None,
+        redacted: bool = False,
+        source: SettingValueStore = SettingValueStore.AUTO,
+        source_manager: SettingsStoreManager | None = None,
+    ) -> t.Any:
+        """Expand env vars referenced in a setting value.
+
+        Args:
+            value: the value to expand
+            metadata: the setting metadata, updated if the value is expanded
+            setting_def: the `SettingDefinition` of the setting
+            redacted: Whether the setting is redacted
+            source: the `SettingsStore` to use
+            source_manager: the `SettingsStoreManager` to use
+
+        Returns:
+            the expanded value
+        """
+        # `.env` values may be `None` for keys declared without a value
+        expandable_env: dict[str, t.Any] = {**self.project.dotenv_env, **self.env}
+        if setting_def and setting_def.is_extra:
+            expandable_env.update(
+                self.as_env(
+                    extras=False,
+                    redacted=redacted,
+                    source=source,
+                    source_manager=source_manager,
                 ),
-                RuntimeWarning,
-                stacklevel=2,
             )
 
-        return value, metadata
+        # Can't do conventional SettingsService.feature_flag call to check;
+        # it would result in circular dependency
+        strict_env_var_mode, _ = source.manager(self.project_settings_service).get(
+            f"{FEATURE_FLAG_PREFIX}.{FeatureFlags.STRICT_ENV_VAR_MODE}",
+            cast_value=True,
+        )
+        expanded_value = do_expand_env_vars(
+            value,
+            env=expandable_env,
+            if_missing=EnvVarMissingBehavior(int(strict_env_var_mode)),
+        )
+        # https://github.com/meltano/meltano/issues/7189#issuecomment-1396112167
+        if value and not expanded_value:  # The whole string was missing env vars
+            expanded_value = None
+
+        if expanded_value != value:
+            metadata["expanded"] = True
+            metadata["unexpanded_value"] = value
+
+        return expanded_value
+
+    def _object_children(
+        self,
+        setting_keys: t.Iterable[str],
+        object_source: SettingValueStore,
+        source: SettingValueStore = SettingValueStore.AUTO,
+        source_manager: SettingsStoreManager | None = None,
+        **kwargs,
+    ) -> tuple[dict, SettingValueStore]:
+        """Collect the flattened values nested under an object setting.
+
+        Args:
+            setting_keys: the name and aliases of the object setting
+            object_source: the source of the object setting's own value
+            source: the `SettingsStore` to use
+            source_manager: the `SettingsStoreManager` to use
+            **kwargs: additional keyword args to pass to `get_with_metadata`
+
+        Returns:
+            a tuple of the nested values and the source that overrides all others
+        """
+        if source_manager:
+            source_manager.bulk = True  # type: ignore[attr-defined]
+        else:
+            source_manager = source.manager(self, bulk=True, **kwargs)
+
+        object_value: dict[str, t.Any] = {}
+        for setting_key in setting_keys:
+            prefix = f"{setting_key}."
+            prefix_len = len(prefix)
+            for nested_def in self.definitions_with_prefix(prefix):
+                # Keys nested under the setting name win over those under aliases
+                nested_key = nested_def.name[prefix_len:]
+                if nested_key in object_value:
+                    continue
+
+                nested_value, nested_metadata = self.get_with_metadata(
+                    nested_def.name,
+                    setting_def=nested_def,
+                    source=source,
+                    source_manager=source_manager,
+                    **kwargs,
+                )
+                object_value[nested_key] = nested_value
+
+                nested_source = nested_metadata["source"]
+                if nested_source.overrides(object_source):
+                    object_source = nested_source
+
+        return object_value, object_source
 
     def get_with_source(self, *args, **kwargs):
         """Get a setting value along with its source.
@@ -486,7 +729,7 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
         Returns:
             the new value and metadata for the setting
         """
-        self.log(f"Setting setting '{path}'")
+        self.log("Setting setting '%s'", path)
 
         if isinstance(path, str):
             path = [path]
@@ -507,7 +750,7 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
 
         if setting_def:
             cast_value = setting_def.cast_value(value)
-            if cast_value != value:
+            if cast_value is not value and cast_value != value:
                 metadata["uncast_value"] = value
                 value = cast_value
 
@@ -520,7 +763,7 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
             ),
         )
 
-        self.log(f"Set setting {name!r} with metadata: {metadata}")
+        self.log("Set setting %r with metadata: %s", name, metadata)
         return value, metadata
 
     def set(self, *args, **kwargs):
@@ -548,7 +791,7 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
         Returns:
             the metadata for the setting
         """
-        self.log(f"Unsetting setting '{path}'")
+        self.log("Unsetting setting '%s'", path)
 
         if isinstance(path, str):
             path = [path]
@@ -568,7 +811,7 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
             **store.manager(self, **kwargs).unset(name, path, setting_def=setting_def),
         }
 
-        self.log(f"Unset setting {name!r} with metadata: {metadata}")
+        self.log("Unset setting %r with metadata: %s", name, metadata)
         return metadata
 
     def reset(self, store=SettingValueStore.AUTO, **kwargs):
@@ -583,10 +826,10 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
             the metadata for the setting
         """
         metadata = {"store": store, **store.manager(self, **kwargs).reset()}
-        self.log(f"Reset settings with metadata: {metadata}")
+        self.log("Reset settings with metadata: %s", metadata)
         return metadata
 
-    def definitions(self, extras: bool | None = None) -> t.Iterable[SettingDefinition]:
+    def definitions(self, extras: bool | None = None) -> list[SettingDefinition]:
         """Return setting definitions along with extras.
 
         Args:
@@ -602,15 +845,65 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
                 if not setting.hidden or self.show_hidden
             ]
 
-        if extras is not None:
-            return [
-                setting
-                for setting in self._setting_defs
-                if (extras is True and setting.is_extra)  # noqa: WPS408
-                or (extras is False and not setting.is_extra)
-            ]
+            self._env_vars_cache = {}
+
+            # Index settings by (interned) name and alias, with the first match
+            # winning, and partition them by whether they are config extras
+            self._setting_index = {}
+            self._setting_defs_extras = []
+            self._setting_defs_non_extras = []
+            for setting in self._setting_defs:
+                for key in (setting.name, *setting.aliases):
+                    self._setting_index.setdefault(sys.intern(key), setting)
+
+                if setting.is_extra:
+                    self._setting_defs_extras.append(setting)
+                else:
+                    self._setting_defs_non_extras.append(setting)
+
+            # Sorted (name, position) pairs, so prefix lookups can bisect
+            self._sorted_setting_names = sorted(
+                (setting.name, position)
+                for position, setting in enumerate(self._setting_defs)
+            )
+
+        if extras is None:
+            return self._setting_defs
+
+        return self._setting_defs_extras if extras else self._setting_defs_non_extras
+
+    def definitions_with_prefix(
+        self,
+        prefix: str,
+        extras: bool | None = None,
+    ) -> list[SettingDefinition]:
+        """Return setting definitions whose name starts with the given prefix.
+
+        Args:
+            prefix: the prefix for setting names
+            extras: whether to return only extras (`True`), only non-extras
+                (`False`) or both (`None`)
 
-        return self._setting_defs
+        Returns:
+            list of matching setting definitions, in definition order
+        """
+        setting_defs = self.definitions()
+        names = self._sorted_setting_names
+
+        # Matching names are contiguous in the sorted index, starting at the
+        # bisection point, so stop at the first name that doesn't match
+        positions = []
+        for index in range(bisect_left(names, (prefix,)), len(names)):
+            name, position = names[index]
+            if not name.startswith(prefix):
+                break
+            positions.append(position)
+
+        return [
+            setting_defs[position]
+            for position in sorted(positions)
+            if extras is None or setting_defs[position].is_extra is bool(extras)
+        ]
 
     def find_setting(self, name: str) -> SettingDefinition:
         """Find a setting by name.
@@ -625,24 +918,49 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
             SettingMissingError: if the setting is not found
 
         """
+        self.definitions()
         try:
-            return next(
-                setting
-                for setting in self.definitions()
-                if setting.name == name or name in setting.aliases
-            )
-        except StopIteration as err:
+            return self._setting_index[name]
+        except KeyError as err:
             raise SettingMissingError(name) from err
 
-    # TODO: The `for_writing` parameter is unused, but referenced elsewhere.
-    # Callers should be updated to not use it, and then it should be removed.
     def setting_env_vars(
         self,
-        setting_def,
-        for_writing=False,  # noqa: ARG002
-    ):
+        setting_def: SettingDefinition,
+        for_writing: bool = False,
+    ) -> list[EnvVar]:
         """Get environment variables for the given setting definition.
 
+        The result is cached per setting definition until the definitions or
+        the env var prefixes are invalidated.
+
+        Args:
+            setting_def: The setting definition to get env vars for.
+            for_writing: Whether to get environment variables for writing.
+
+        Returns:
+            Environment variables for given setting
+        """
+        key = (id(setting_def), for_writing)
+        with suppress(KeyError):
+            cached_def, env_vars = self._env_vars_cache[key]
+            # Holding on to the definition means its id can't be reused
+            if cached_def is setting_def:
+                return env_vars
+
+        env_vars = self._setting_env_vars(setting_def, for_writing=for_writing)
+        self._env_vars_cache[key] = (setting_def, env_vars)
+        return env_vars
+
+    # TODO: The `for_writing` parameter is unused, but referenced elsewhere.
+    # Callers should be updated to not use it, and then it should be removed.
+    def _setting_env_vars(
+        self,
+        setting_def: SettingDefinition,
+        for_writing: bool = False,  # noqa: ARG002
+    ) -> list[EnvVar]:
+        """Build the environment variables for the given setting definition.
+
         Args:
             setting_def: The setting definition to get env vars for.
             for_writing: Unused parameter.
@@ -650,7 +968,48 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
         Returns:
             Environment variables for given setting
         """
-        return setting_def.env_vars(self.env_prefixes)
+        return setting_def.env_vars(self._cached_env_prefixes())
+
+    def invalidate_env_prefixes(self) -> None:
+        """Forget the env var prefixes resolved so far.
+
+        Subclasses whose prefixes depend on mutable state should call this
+        after that state changes.
+        """
+        self._env_prefixes_cache = {}
+        self._env_vars_cache = {}
+
+    def _resolve_env_prefixes(
+        self,
+        for_writing: bool = False,  # noqa: ARG002
+    ) -> t.Iterable[str]:
+        """Resolve the prefixes for setting environment variables.
+
+        Args:
+            for_writing: Whether the env vars will be written to.
+
+        Returns:
+            prefixes for settings environment variables
+        """
+        return self.env_prefixes
+
+    def _cached_env_prefixes(self, for_writing: bool = False) -> tuple[str, ...]:
+        """Return the prefixes for setting environment variables.
+
+        They are resolved once per instance, until `invalidate_env_prefixes`.
+
+        Args:
+            for_writing: Whether the env vars will be written to.
+
+        Returns:
+            prefixes for settings environment variables
+        """
+        try:
+            return self._env_prefixes_cache[for_writing]
+        except KeyError:
+            prefixes = tuple(self._resolve_env_prefixes(for_writing=for_writing))
+            self._env_prefixes_cache[for_writing] = prefixes
+            return prefixes
 
     def setting_env(self, setting_def):
         """Get a single environment variable for the given setting definition.
@@ -663,14 +1022,17 @@ class SettingsService(metaclass=ABCMeta):  # noqa: WPS214
         """
         return self.setting_env_vars(setting_def)[0].key
 
-    def log(self, message):
+    def log(self, message: str, *args: t.Any) -> None:
         """Log the given message.
 
+        The message is only formatted when logging is enabled.
+
         Args:
-            message: the message to log
+            message: the message to log, optionally with `%`-style placeholders
+            args: the values for the placeholders in `message`
         """
         if self.LOGGING:
-            logger.debug(message)
+            logger.debug(message % args if args else message)
 
     @contextmanager
     def feature_flag(
@@ -100,7 +100,7 @@ def cast_setting_value(
     """
     if setting_def is not None:
         cast_value = setting_def.cast_value(value)
-        if cast_value != value:
+        if cast_value is not value and cast_value != value:
             return cast_value, {**metadata, "uncast_value": value}
     return value, metadata
 
@@ -241,6 +241,26 @@ class SettingsStoreManager(ABC):
             cast_value: Whether to cast the value according to `setting_def`.
         """
 
+    def get_many(
+        self,
+        setting_defs: t.Sequence[SettingDefinition],
+    ) -> list[tuple[t.Any, dict]]:
+        """Get the values of several settings at once.
+
+        Stores that can fetch many values more cheaply than one at a time
+        should override this.
+
+        Args:
+            setting_defs: SettingDefinition instances of the settings to get.
+
+        Returns:
+            A `(value, metadata)` tuple per setting, in the order given.
+        """
+        return [
+            self.get(setting_def.name, setting_def=setting_def)
+            for setting_def in setting_defs
+        ]
+
     def set(
         self,
         name: str,
@@ -299,13 +319,14 @@ class SettingsStoreManager(ABC):
         if method != "get" and not self.writable:
             raise StoreNotSupportedError
 
-    def log(self, message: str) -> None:
+    def log(self, message: str, *args: t.Any) -> None:
         """Log method.
 
         Args:
-            message: message to log.
+            message: message to log, optionally with `%`-style placeholders.
+            args: values for the placeholders in `message`.
         """
-        self.settings_service.log(message)
+        self.settings_service.log(message, *args)
 
 
 class ConfigOverrideStoreManager(SettingsStoreManager):
@@ -331,7 +352,7 @@ class ConfigOverrideStoreManager(SettingsStoreManager):
         """
         try:
             value = self.settings_service.config_override[name]
-            self.log(f"Read key '{name}' from config override: {value!r}")
+            self.log("Read key '%s' from config override: %r", name, value)
             return value, {}
         except KeyError:
             return None, {}
@@ -433,7 +454,7 @@ class EnvStoreManager(BaseEnvStoreManager):
 
         if value is not None:
             env_key = metadata["env_var"]
-            self.log(f"Read key '{env_key}' from the environment: {value!r}")
+            self.log("Read key '%s' from the environment: %r", env_key, value)
 
         return value, metadata
 
@@ -494,7 +515,7 @@ class DotEnvStoreManager(BaseEnvStoreManager):
 
         if value is not None:
             env_key = metadata["env_var"]
-            self.log(f"Read key '{env_key}' from `.env`: {value!r}")
+            self.log("Read key '%s' from `.env`: %r", env_key, value)
 
         return value, metadata
 
@@ -524,13 +545,13 @@ class DotEnvStoreManager(BaseEnvStoreManager):
             if dotenv_file.exists():
                 for key in other_keys:
                     dotenv.unset_key(dotenv_file, key)
-                    self.log(f"Unset key '{key}' in `.env`")
+                    self.log("Unset key '%s' in `.env`", key)
             else:
                 dotenv_file.touch()
 
             dotenv.set_key(dotenv_file, primary_key, setting_def.stringify_value(value))
 
-        self.log(f"Set key '{primary_key}' in `.env`: {value!r}")
+        self.log("Set key '%s' in `.env`: %r", primary_key, value)
         return {"env_var": primary_key}
 
     def unset(
@@ -564,7 +585,7 @@ class DotEnvStoreManager(BaseEnvStoreManager):
 
             for key in env_keys:
                 dotenv.unset_key(dotenv_file, key)
-                self.log(f"Unset key '{key}' in `.env`")
+                self.log("Unset key '%s' in `.env`", key)
 
         return {}
 
@@ -659,7 +680,7 @@ class MeltanoYmlStoreManager(SettingsStoreManager):
             except KeyError:
                 continue
 
-            self.log(f"Read key '{key}' from `meltano.yml`: {value!r}")
+            self.log("Read key '%s' from `meltano.yml`: %r", key, value)
             vals_with_metadata.append((value, {"key": key, "expandable": True}))
 
         if len(vals_with_metadata) > 1 and not reduce(
@@ -710,14 +731,14 @@ class MeltanoYmlStoreManager(SettingsStoreManager):
         with self.update_config() as config:
             for key in keys_to_unset:
                 config.pop(key, None)
-                self.log(f"Popped key '{key}' in `meltano.yml`")
+                self.log("Popped key '%s' in `meltano.yml`", key)
 
             for path_to_unset in paths_to_unset:
                 pop_at_path(config, path_to_unset, None)
-                self.log(f"Popped path '{path_to_unset}' in `meltano.yml`")
+                self.log("Popped path '%s' in `meltano.yml`", path_to_unset)
 
             set_at_path(config, path, value)
-            self.log(f"Set path '{path}' in `meltano.yml`: {value!r}")
+            self.log("Set path '%s' in `meltano.yml`: %r", path, value)
 
         return {}
 
@@ -746,14 +767,14 @@ class MeltanoYmlStoreManager(SettingsStoreManager):
         with self.update_config() as config:
             for key in keys_to_unset:
                 config.pop(key, None)
-                self.log(f"Popped key '{key}' in `meltano.yml`")
+                self.log("Popped key '%s' in `meltano.yml`", key)
 
             for path_to_unset in paths_to_unset:
                 pop_at_path(config, path_to_unset, None)
-                self.log(f"Popped path '{path_to_unset}' in `meltano.yml`")
+                self.log("Popped path '%s' in `meltano.yml`", path_to_unset)
 
             pop_at_path(config, path, None)
-            self.log(f"Popped path '{path}' in `meltano.yml`")
+            self.log("Popped path '%s' in `meltano.yml`", path)
 
         return {}
 
@@ -797,6 +818,7 @@ class MeltanoYmlStoreManager(SettingsStoreManager):
             raise StoreNotSupportedError(err) from err
 
         self._flat_config = None
+        self.settings_service.invalidate_flat_meltano_yml_config()
 
         # This is not quite the right place for this, but we need to create
         # setting defs for missing keys again when `meltano.yml` changes
@@ -941,7 +963,7 @@ class DbStoreManager(SettingsStoreManager):
                     .value
                 )
 
-            self.log(f"Read key '{name}' from system database: {value!r}")
+            self.log("Read key '%s' from system database: %r", name, value)
             return value, {}
         except (sqlalchemy.orm.exc.NoResultFound, KeyError):
             return None, {}
@@ -975,7 +997,7 @@ class DbStoreManager(SettingsStoreManager):
 
         self._all_settings = None
 
-        self.log(f"Set key '{name}' in system database: {value!r}")
+        self.log("Set key '%s' in system database: %r", name, value)
         return {}
 
     def unset(
@@ -1002,7 +1024,7 @@ class DbStoreManager(SettingsStoreManager):
 
         self._all_settings = None
 
-        self.log(f"Deleted key '{name}' from system database")
+        self.log("Deleted key '%s' from system database", name)
         return {}
 
     def reset(self) -> dict:
@@ -1099,7 +1121,7 @@ class InheritedStoreManager(SettingsStoreManager):
         if value is None or metadata["source"] is SettingValueStore.DEFAULT:
             return None, {}
 
-        self.log(f"Read key '{name}' from inherited: {value!r}")
+        self.log("Read key '%s' from inherited: %r", name, value)
         return value, {
             "inherited_source": metadata["source"],
             "expandable": metadata.get("expandable", False),
@@ -1169,7 +1191,7 @@ class DefaultStoreManager(SettingsStoreManager):
         if setting_def:
             value = setting_def.value
             if value is not None:
-                self.log(f"Read key '{name}' from default: {value!r}")
+                self.log("Read key '%s' from default: %r", name, value)
                 return value, {"expandable": True}
         # As default is lowest in our order of precedence, we want it to always return
         # a value, even if it is None.
@@ -1336,36 +1358,17 @@ class AutoStoreManager(SettingsStoreManager):
         """
         setting_def = setting_def or self.find_setting(name)
 
-        metadata = {}
-        value = None
-        found_source = None
-
-        for source in self.sources:
-            try:
-                manager = self.manager_for(source)
-            except StoreNotSupportedError:
-                continue
-
-            try:
-                value, metadata = manager.get(
+        [(value, metadata)] = self._get_by_precedence(
+            [(name, setting_def)],
+            lambda manager, _: [
+                manager.get(
                     name,
                     setting_def=setting_def,
                     cast_value=cast_value,
                     **kwargs,
-                )
-            except StoreNotSupportedError:
-                continue
-
-            found_source = source
-
-            if value is not None:
-                break
-
-        metadata["source"] = found_source
-
-        if auto_store := self.auto_store(name, setting_def=setting_def):
-            metadata["auto_store"] = auto_store
-            metadata["overwritable"] = auto_store.can_overwrite(found_source)
+                ),
+            ],
+        )
 
         return (
             cast_setting_value(value, metadata, setting_def)
@@ -1373,6 +1376,77 @@ class AutoStoreManager(SettingsStoreManager):
             else (value, metadata)
         )
 
+    def get_many(
+        self,
+        setting_defs: t.Sequence[SettingDefinition],
+    ) -> list[tuple[t.Any, dict]]:
+        """Get the values of several settings, batching the reads for each store.
+
+        Args:
+            setting_defs: SettingDefinition instances of the settings to get.
+
+        Returns:
+            A `(value, metadata)` tuple per setting, in the order given.
+        """
+        return self._get_by_precedence(
+            [(setting_def.name, setting_def) for setting_def in setting_defs],
+            lambda manager, pending: manager.get_many(
+                [setting_defs[index] for index in pending],
+            ),
+        )
+
+    def _get_by_precedence(
+        self,
+        settings: list[tuple[str, SettingDefinition | None]],
+        read: t.Callable[[SettingsStoreManager, list[int]], list[tuple[t.Any, dict]]],
+    ) -> list[tuple[t.Any, dict]]:
+        """Read settings from each source in order of precedence.
+
+        Each setting is read from the next source for as long as its value is
+        `None`. Sources that don't support reading are skipped.
+
+        Args:
+            settings: `(name, setting_def)` of each setting to get.
+            read: Reads the settings at the given indexes from a store manager.
+
+        Returns:
+            A `(value, metadata)` tuple per setting, in the order given.
+        """
+        values: list[t.Any] = [None] * len(settings)
+        metadatas: list[dict] = [{} for _ in settings]
+        found_sources: list[SettingValueStore | None] = [None] * len(settings)
+        pending = list(range(len(settings)))
+
+        for source in self.sources:
+            if not pending:
+                break
+
+            try:
+                manager = self.manager_for(source)
+                source_values = read(manager, pending)
+            except StoreNotSupportedError:
+                continue
+
+            still_pending = []
+            for index, (value, metadata) in zip(pending, source_values):
+                values[index], metadatas[index] = value, metadata
+                found_sources[index] = source
+                if value is None:
+                    still_pending.append(index)
+            pending = still_pending
+
+        for (name, setting_def), metadata, found_source in zip(
+            settings,
+            metadatas,
+            found_sources,
+        ):
+            metadata["source"] = found_source
+            if auto_store := self.auto_store(name, setting_def=setting_def):
+                metadata["auto_store"] = auto_store
+                metadata["overwritable"] = auto_store.can_overwrite(found_source)
+
+        return list(zip(values, metadatas))
+
     def set(self, name: str, path: list[str], value, setting_def=None) -> dict:
         """Set a Setting by name, path and (optionally) SettingDefinition.
 
@@ -100,11 +100,8 @@ def state_store_manager_from_project_settings(  # noqa: WPS210
         lambda setting_def: setting_def.name.startswith(
             f"state_backend.{'gcs' if scheme == 'gs' else scheme}",  # noqa: WPS509
         )
-        or (
-            setting_def.name.startswith("state_backend")
-            and len(setting_def.name.split(".")) == 2
-        ),
-        settings_service.setting_definitions,
+        or len(setting_def.name.split(".")) == 2,
+        settings_service.definitions_with_prefix("state_backend"),
     )
     settings = (setting_def.name for setting_def in setting_defs)
     backend = StateBackend(scheme).manager
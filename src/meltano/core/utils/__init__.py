@@ -236,6 +236,10 @@ def nest_object(flat_object):
     return obj
 
 
+_ENV_VAR_INVALID_CHARS_PATTERN = re.compile("[^A-Za-z0-9]")
+
+
+@functools.lru_cache(maxsize=4096)
 def to_env_var(*xs: str) -> str:
     """Convert a list of strings to an environment variable name.
 
@@ -253,7 +257,7 @@ def to_env_var(*xs: str) -> str:
         >>> to_env_var("foo.bar")
         'FOO_BAR'
     """
-    return "_".join(re.sub("[^A-Za-z0-9]", "_", x).upper() for x in xs if x)
+    return "_".join(_ENV_VAR_INVALID_CHARS_PATTERN.sub("_", x).upper() for x in xs if x)
 
 
 def flatten(d: dict, reducer: str | t.Callable = "tuple", **kwargs):
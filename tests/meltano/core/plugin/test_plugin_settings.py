@@ -485,6 +485,14 @@ class TestPluginSettingsService:
             assert "test_a" not in extractor.config
             assert "test_b" not in extractor.config
 
+    def test_flat_meltano_yml_config(self, subject, monkeypatch):
+        # The plugin config may be edited in place, so it is not cached
+        monkeypatch.setitem(subject.plugin.config, "test_a", "THIS_IS_FROM_YML")
+        assert subject.flat_meltano_yml_config["test_a"] == "THIS_IS_FROM_YML"
+
+        monkeypatch.setitem(subject.plugin.config, "test_a", "CHANGED_IN_PLACE")
+        assert subject.flat_meltano_yml_config["test_a"] == "CHANGED_IN_PLACE"
+
     @pytest.mark.order(2)
     @pytest.mark.usefixtures("tap")
     def test_store_dotenv(self, subject: PluginSettingsService, project: Project):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from contextlib import contextmanager
 
 import mock
@@ -8,8 +9,8 @@ import pytest
 from meltano.core.environment import Environment
 from meltano.core.project import Project
 from meltano.core.project_settings_service import ProjectSettingsService
-from meltano.core.setting_definition import SettingDefinition
-from meltano.core.settings_service import SettingsService
+from meltano.core.setting_definition import SettingDefinition, SettingMissingError
+from meltano.core.settings_service import REDACTED_VALUE, SettingsService
 from meltano.core.settings_store import (
     AutoStoreManager,
     InheritedStoreManager,
@@ -302,6 +303,35 @@ class TestAutoStoreManager:
         assert metadata["auto_store"] == Store.DB
         assert metadata["overwritable"] is False
 
+    def test_get_many(self, subject, set_value_store):
+        set_value_store("from_meltano_yml", Store.MELTANO_YML)
+        set_value_store("from_dotenv", Store.DOTENV, name="password")
+
+        setting_defs = list(subject.settings_service.definitions())
+        assert subject.get_many(setting_defs) == [
+            subject.get(setting_def.name, setting_def=setting_def)
+            for setting_def in setting_defs
+        ]
+
+    def test_get_many_db(self, subject, set_value_store, session):
+        set_value_store("from_db", Store.DB)
+        set_value_store("from_db", Store.DB, name="password")
+
+        manager = subject.manager_for(Store.DB)
+        setting_defs = list(subject.settings_service.definitions())
+        assert manager.get_many(setting_defs) == [
+            manager.get(setting_def.name, setting_def=setting_def)
+            for setting_def in setting_defs
+        ]
+        assert manager.get_many(setting_defs)[0] == ("from_db", {})
+
+        bulk_manager = Store.DB.manager(
+            subject.settings_service,
+            bulk=True,
+            session=session,
+        )
+        assert bulk_manager.get_many(setting_defs) == manager.get_many(setting_defs)
+
     @pytest.mark.usefixtures("set_value_store")
     def test_set(
         self,
@@ -637,3 +667,145 @@ class TestInheritedStoreManager:
         assert metadata["inherited_source"] is Store.DOTENV
         # Lack of env var expandability is inherited
         assert not metadata["expandable"]
+
+
+class TestSettingsService:
+    @pytest.fixture()
+    def subject(self, dummy_settings_service):
+        yield dummy_settings_service
+        dummy_settings_service.reset(store=Store.MELTANO_YML)
+
+    def test_flat_meltano_yml_config_cache(self, subject):
+        flat_config = subject.flat_meltano_yml_config
+        assert subject.flat_meltano_yml_config is flat_config
+
+        subject.invalidate_flat_meltano_yml_config()
+        assert subject.flat_meltano_yml_config is not flat_config
+        flat_config = subject.flat_meltano_yml_config
+
+        subject.set("regular", "value", store=Store.MELTANO_YML)
+
+        assert subject.flat_meltano_yml_config is not flat_config
+        assert subject.flat_meltano_yml_config == {"regular": "value"}
+
+    def test_find_setting(self, subject):
+        regular = subject.find_setting("regular")
+        assert regular.name == "regular"
+        assert subject.find_setting("basic") is regular
+
+        with pytest.raises(SettingMissingError):
+            subject.find_setting("missing")
+
+    def test_definitions_with_prefix(self, subject):
+        assert subject.definitions_with_prefix("re") == [
+            subject.find_setting("regular"),
+        ]
+        assert subject.definitions_with_prefix("regular.") == []
+        assert [
+            setting_def.name for setting_def in subject.definitions_with_prefix("")
+        ] == ["regular", "password", "env_specific"]
+
+    def test_definitions_with_prefix_sorted_index(self, subject, monkeypatch):
+        setting_defs = [
+            SettingDefinition(f"group_{group}.setting_{index:02d}")
+            for index in range(50)
+            for group in "dcba"
+        ]
+        monkeypatch.setattr(
+            DummySettingsService,
+            "setting_definitions",
+            property(lambda _: setting_defs),
+        )
+        subject._setting_defs = None
+        subject.definitions()
+
+        names = subject._sorted_setting_names
+        assert names == sorted(names)
+        assert [setting_defs[position].name for _, position in names] == sorted(
+            setting_def.name for setting_def in setting_defs
+        )
+
+        reads = []
+
+        class _Names(list):
+            def __getitem__(self, index):
+                reads.append(index)
+                return super().__getitem__(index)
+
+        subject._sorted_setting_names = _Names(names)
+        assert subject.definitions_with_prefix("group_b.") == [
+            setting_def
+            for setting_def in setting_defs
+            if setting_def.name.startswith("group_b.")
+        ]
+        # The scan starts at the first match and stops at the first non-match
+        assert reads[-51:] == list(range(50, 101))
+
+    def test_env(self, subject, monkeypatch):
+        monkeypatch.setenv("DUMMY_FROM_ENVIRON", "environ")
+        monkeypatch.setenv("DUMMY_OVERRIDDEN", "environ")
+        subject.env_override = {
+            "DUMMY_OVERRIDDEN": "override",
+            "DUMMY_FROM_OVERRIDE": "override",
+        }
+
+        env = subject.env
+        assert env["DUMMY_FROM_ENVIRON"] == "environ"
+        assert env["DUMMY_OVERRIDDEN"] == "override"
+        assert env["DUMMY_FROM_OVERRIDE"] == "override"
+        assert "DUMMY_MISSING" not in env
+        assert dict(env) == {**os.environ, **subject.env_override}
+        assert len(env) == len(dict(env))
+
+        monkeypatch.setenv("DUMMY_SET_LATER", "environ")
+        assert env["DUMMY_SET_LATER"] == "environ"
+
+    def test_unredacted_items(self, subject):
+        values = {"regular": "value", "password": REDACTED_VALUE}
+
+        assert list(subject.unredacted_items(values)) == [("regular", "value")]
+        assert subject.unredact(values) == {"regular": "value"}
+
+    def test_invalidate_env_prefixes(self, subject, monkeypatch):
+        prefixes = ["dummy"]
+        monkeypatch.setattr(
+            DummySettingsService,
+            "env_prefixes",
+            property(lambda _: prefixes),
+        )
+        setting_def = subject.find_setting("regular")
+        assert subject.setting_env(setting_def) == "DUMMY_REGULAR"
+
+        # Prefixes are resolved once, until invalidated
+        prefixes[:] = ["other"]
+        assert subject.setting_env(setting_def) == "DUMMY_REGULAR"
+
+        subject.invalidate_env_prefixes()
+        assert subject.setting_env(setting_def) == "OTHER_REGULAR"
+        assert [env_var.key for env_var in subject.setting_env_vars(setting_def)] == [
+            "OTHER_REGULAR",
+            "OTHER_BASIC",
+        ]
+
+    def test_setting_env_vars_cache(self, subject, monkeypatch):
+        setting_def = subject.find_setting("regular")
+        env_vars = subject.setting_env_vars(setting_def)
+        assert subject.setting_env_vars(setting_def) is env_vars
+        assert subject.setting_env_vars(setting_def, for_writing=True) is not env_vars
+
+        setting_defs = [SettingDefinition("regular", aliases=["renamed"])]
+        monkeypatch.setattr(
+            DummySettingsService,
+            "setting_definitions",
+            property(lambda _: setting_defs),
+        )
+        subject._setting_defs = None
+        new_setting_def = subject.find_setting("regular")
+
+        assert new_setting_def is setting_defs[0]
+        env_vars_keys = [
+            env_var.key for env_var in subject.setting_env_vars(new_setting_def)
+        ]
+        assert env_vars_keys == ["DUMMY_REGULAR", "DUMMY_RENAMED"]
+        # The old definition's entries were dropped with the definitions
+        assert subject.setting_env_vars(setting_def) is not env_vars